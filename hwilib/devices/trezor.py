@@ -358,6 +358,10 @@ class TrezorClient(HardwareWalletClient):
             for psbt_in in tx.inputs:
                 if psbt_in.non_witness_utxo:
                     prev = psbt_in.non_witness_utxo
+                    prev_hash = ser_uint256(prev.sha256)[::-1]
+                    # Inputs spending outputs of the same parent share its non_witness_utxo, only convert it once
+                    if prev_hash in prevtxs:
+                        continue
 
                     t = proto.TransactionType()
                     t.version = prev.nVersion
@@ -377,7 +381,7 @@ class TrezorClient(HardwareWalletClient):
                         o.script_pubkey = vout.scriptPubKey
                         t.bin_outputs.append(o)
                     logging.debug(psbt_in.non_witness_utxo.hash)
-                    prevtxs[ser_uint256(psbt_in.non_witness_utxo.sha256)[::-1]] = t
+                    prevtxs[prev_hash] = t
 
             # Sign the transaction
             tx_details = proto.SignTx()
@@ -17,7 +17,7 @@
 import logging
 import sys
 import time
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Union
 
 from . import DEV_TREZOR1, DEV_KEEPKEY, UDEV_RULES_STR, TransportException
 from .protocol import ProtocolBasedTransport, ProtocolV1
@@ -36,6 +36,8 @@ HidDeviceHandle = Any
 
 
 class HidHandle:
+    __slots__ = ("path", "serial", "handle", "hid_version")
+
     def __init__(
         self, path: bytes, serial: str, probe_hid_version: bool = False
     ) -> None:
@@ -77,12 +79,12 @@ class HidHandle:
             self.handle.close()
         self.handle = None
 
-    def write_chunk(self, chunk: bytes) -> None:
+    def write_chunk(self, chunk: Union[bytes, memoryview]) -> None:
         if len(chunk) != 64:
             raise TransportException("Unexpected chunk size: %d" % len(chunk))
 
         if self.hid_version == 2:
-            self.handle.write(b"\0" + bytearray(chunk))
+            self.handle.write(b"\0" + chunk)
         else:
             self.handle.write(chunk)
 
@@ -18,15 +18,21 @@ import logging
 import os
 import struct
 from io import BytesIO
-from typing import Tuple
+from typing import Tuple, Union
 
-from typing_extensions import Protocol as StructuralType
+try:
+    from typing import Protocol as StructuralType
+except ImportError:  # Python < 3.8
+    from typing_extensions import Protocol as StructuralType
 
 from . import Transport
 from .. import mapping, protobuf
 
 REPLEN = 64
 
+# Message type and payload length following the "##" magic of the first report
+HEADER = struct.Struct(">HL")
+
 V2_FIRST_CHUNK = 0x01
 V2_NEXT_CHUNK = 0x02
 V2_BEGIN_SESSION = 0x03
@@ -45,6 +51,13 @@ class Handle(StructuralType):
     Functionally we gain nothing from making this an (abstract) base class for handle
     implementations, so this definition is for type hinting purposes only. You can,
     but don't have to, inherit from it.
+
+    Chunks to write may be handed out as memoryviews into a larger buffer.
+
+    A Handle that can send several chunks in a single transfer may also provide
+    `write_chunks(chunks: Union[bytes, bytearray]) -> None`, taking any whole
+    number of 64-byte chunks. Protocols use it instead of calling `write_chunk`
+    once per chunk.
     """
 
     def open(self) -> None:
@@ -56,7 +69,7 @@ class Handle(StructuralType):
     def read_chunk(self) -> bytes:
         ...
 
-    def write_chunk(self, chunk: bytes) -> None:
+    def write_chunk(self, chunk: Union[bytes, memoryview]) -> None:
         ...
 
 
@@ -134,63 +147,99 @@ class ProtocolV1(Protocol):
     VERSION = 1
 
     def write(self, msg: protobuf.MessageType) -> None:
-        LOG.debug(
-            "sending message: {}".format(msg.__class__.__name__),
-            extra={"protobuf": msg},
-        )
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "sending message: %s", msg.__class__.__name__, extra={"protobuf": msg}
+            )
         data = BytesIO()
         protobuf.dump_message(data, msg)
-        ser = data.getvalue()
-        header = struct.pack(">HL", mapping.get_type(msg), len(ser))
-        buffer = bytearray(b"##" + header + ser)
-
-        while buffer:
-            # Report ID, data padded to 63 bytes
-            chunk = b"?" + buffer[: REPLEN - 1]
-            chunk = chunk.ljust(REPLEN, b"\x00")
+        # View the serialized message in place, it is copied into the reports below
+        ser = data.getbuffer()
+
+        if len(ser) <= REPLEN - 3 - HEADER.size:
+            # Most messages fit in a single report: "?##", header, data, padding
+            chunk = bytearray(REPLEN)
+            chunk[0:3] = b"?##"
+            HEADER.pack_into(chunk, 3, mapping.get_type(msg), len(ser))
+            chunk[3 + HEADER.size : 3 + HEADER.size + len(ser)] = ser
             self.handle.write_chunk(chunk)
-            buffer = buffer[63:]
+            return
+
+        # Lay out all reports in one zero-filled buffer: report ID followed by
+        # 63 bytes of data, the last report being padded with zeroes.
+        # The first report starts with the "##" magic and the header.
+        n_chunks = (2 + HEADER.size + len(ser) + REPLEN - 2) // (REPLEN - 1)
+        buffer = bytearray(n_chunks * REPLEN)
+        buffer[::REPLEN] = b"?" * n_chunks
+        buffer[1:3] = b"##"
+        HEADER.pack_into(buffer, 3, mapping.get_type(msg), len(ser))
+
+        pos = 0
+        for i in range(n_chunks):
+            offset = i * REPLEN + (3 + HEADER.size if i == 0 else 1)
+            n = min(len(ser) - pos, (i + 1) * REPLEN - offset)
+            buffer[offset : offset + n] = ser[pos : pos + n]
+            pos += n
+
+        write_chunks = getattr(self.handle, "write_chunks", None)
+        if write_chunks is not None:
+            write_chunks(buffer)
+            return
+
+        chunks = memoryview(buffer)
+        for i in range(n_chunks):
+            self.handle.write_chunk(chunks[i * REPLEN : (i + 1) * REPLEN])
 
     def read(self) -> protobuf.MessageType:
-        buffer = bytearray()
         # Read header with first part of message data
         msg_type, datalen, first_chunk = self.read_first()
-        buffer.extend(first_chunk)
 
-        # Read the rest of the message
-        while len(buffer) < datalen:
-            buffer.extend(self.read_next())
-
-        # Strip padding
-        data = BytesIO(buffer[:datalen])
+        if datalen <= len(first_chunk):
+            # The whole message came in the first report, strip padding
+            data = BytesIO(first_chunk[:datalen])
+        else:
+            data = BytesIO(self.read_rest(first_chunk, datalen))
 
         # Parse to protobuf
         msg = protobuf.load_message(data, mapping.get_class(msg_type))
-        LOG.debug(
-            "received message: {}".format(msg.__class__.__name__),
-            extra={"protobuf": msg},
-        )
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "received message: %s", msg.__class__.__name__, extra={"protobuf": msg}
+            )
         return msg
 
-    def read_first(self) -> Tuple[int, int, bytes]:
+    def read_rest(self, first_chunk: memoryview, datalen: int) -> bytearray:
+        # Collect the message data in a buffer of exactly the announced length,
+        # which leaves out the padding of the last report
+        buffer = bytearray(datalen)
+        view = memoryview(buffer)
+        pos = len(first_chunk)
+        view[:pos] = first_chunk
+
+        # Read the rest of the message
+        while pos < datalen:
+            chunk = self.handle.read_chunk()
+            if chunk[0] != 0x3F:  # "?"
+                raise RuntimeError("Unexpected magic characters")
+            n = min(len(chunk) - 1, datalen - pos)
+            view[pos : pos + n] = memoryview(chunk)[1 : 1 + n]
+            pos += n
+
+        return buffer
+
+    def read_first(self) -> Tuple[int, int, memoryview]:
         chunk = self.handle.read_chunk()
-        if chunk[:3] != b"?##":
+        # "?##"
+        if chunk[0] != 0x3F or chunk[1] != 0x23 or chunk[2] != 0x23:
             raise RuntimeError("Unexpected magic characters")
         try:
-            headerlen = struct.calcsize(">HL")
-            msg_type, datalen = struct.unpack(">HL", chunk[3 : 3 + headerlen])
+            msg_type, datalen = HEADER.unpack_from(chunk, 3)
         except Exception:
             raise RuntimeError("Cannot parse header")
 
-        data = chunk[3 + headerlen :]
+        data = memoryview(chunk)[3 + HEADER.size :]
         return msg_type, datalen, data
 
-    def read_next(self) -> bytes:
-        chunk = self.handle.read_chunk()
-        if chunk[:1] != b"?":
-            raise RuntimeError("Unexpected magic characters")
-        return chunk[1:]
-
 
 def get_protocol(handle: Handle, want_v2: bool) -> Protocol:
     """Make a Protocol instance for the given handle.
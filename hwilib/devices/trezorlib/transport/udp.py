@@ -15,7 +15,7 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import socket
-from typing import Iterable, Optional, cast
+from typing import Iterable, Optional, Union, cast
 
 from . import TransportException
 from .protocol import ProtocolBasedTransport, get_protocol
@@ -103,7 +103,7 @@ class UdpTransport(ProtocolBasedTransport):
             pass
         return resp == b"PONGPONG"
 
-    def write_chunk(self, chunk: bytes) -> None:
+    def write_chunk(self, chunk: Union[bytes, memoryview]) -> None:
         assert self.socket is not None
         if len(chunk) != 64:
             raise TransportException("Unexpected data length")
@@ -18,7 +18,7 @@ import atexit
 import logging
 import sys
 import time
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Union
 
 from . import TREZORS, UDEV_RULES_STR, TransportException
 from .protocol import ProtocolBasedTransport, ProtocolV1
@@ -38,6 +38,8 @@ DEBUG_ENDPOINT = 2
 
 
 class WebUsbHandle:
+    __slots__ = ("device", "interface", "endpoint", "count", "handle")
+
     def __init__(self, device: "usb1.USBDevice", debug: bool = False) -> None:
         self.device = device
         self.interface = DEBUG_INTERFACE if debug else INTERFACE
@@ -61,12 +63,19 @@ class WebUsbHandle:
             self.handle.close()
         self.handle = None
 
-    def write_chunk(self, chunk: bytes) -> None:
+    def write_chunk(self, chunk: Union[bytes, memoryview]) -> None:
         assert self.handle is not None
         if len(chunk) != 64:
             raise TransportException("Unexpected chunk size: %d" % len(chunk))
         self.handle.interruptWrite(self.endpoint, chunk)
 
+    def write_chunks(self, chunks: Union[bytes, bytearray]) -> None:
+        assert self.handle is not None
+        if len(chunks) % 64 != 0:
+            raise TransportException("Unexpected data size: %d" % len(chunks))
+        # A single interrupt transfer, split into 64-byte packets by the host
+        self.handle.interruptWrite(self.endpoint, chunks)
+
     def read_chunk(self) -> bytes:
         assert self.handle is not None
         endpoint = 0x80 | self.endpoint
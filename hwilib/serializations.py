@@ -36,7 +36,10 @@ from typing import (
     Callable,
 )
 
-from typing_extensions import Protocol
+try:
+    from typing import Protocol
+except ImportError:  # Python < 3.8
+    from typing_extensions import Protocol
 
 class Readable(Protocol):
     def read(self, n: int = -1) -> bytes: